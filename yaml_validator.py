@@ -1,28 +1,81 @@
 import sys
+import re
+import hashlib
+import functools
 import yaml
-from typing import Optional
+from typing import Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
 import os
+import mmap
+import queue
+import threading
 import webbrowser
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QTextEdit, QLabel, 
                             QFileDialog, QMessageBox, QMenuBar, QMenu, QStatusBar,
                             QFrame, QScrollBar, QPlainTextEdit)
-from PyQt6.QtCore import Qt, QMimeData, QRect, QSize
+from PyQt6.QtCore import (Qt, QMimeData, QRect, QSize, QEvent, QObject,
+                          QRunnable, QThreadPool, QTimer,
+                          QRegularExpression, pyqtSignal)
 from PyQt6.QtGui import (QDragEnterEvent, QDropEvent, QIcon, QAction, 
-                        QPainter, QColor, QTextFormat, QTextCursor)
+                        QPainter, QColor, QTextFormat, QTextCursor,
+                        QSyntaxHighlighter, QTextCharFormat)
+
+# libyamlが利用可能ならCベースのローダーを使用する
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# 型判定用の参照 (ローダーは組み込みのdict/listのみを返す)
+_DICT = dict
+_LIST = list
+
+# 空行・コメント行を除いた、インデントされた行 (先頭行は _LEADING_INDENT_RE で扱う)
+_INDENT_RE = re.compile(r'\n([^\S\n]+)[^\s#]')
+_LEADING_INDENT_RE = re.compile(r'([^\S\n]+)[^\s#]')
+
+
+@functools.lru_cache(maxsize=16)
+def _misaligned_indent_re(width: int):
+    """インデント幅が width の倍数でない行だけにマッチするパターン"""
+    return re.compile(r'\n(?:[^\S\n]{%d})*[^\S\n]{1,%d}[^\s#]' % (width, width - 1))
 
 class YAMLValidator:
+    # 検証結果キャッシュの最大件数
+    CACHE_SIZE = 32
+
     def __init__(self):
         self.errors = []
         self.warnings = []
+        # 内容のハッシュ -> (errors, warnings)。巨大な文字列をキーに保持しない
+        self._cache = OrderedDict()
 
     def validate_content(self, content: str) -> bool:
+        key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        else:
+            cached = self._validate_uncached(content)
+            self._cache[key] = cached
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        self.errors = list(cached[0])
+        self.warnings = list(cached[1])
+        return len(self.errors) == 0
+
+    def _validate_uncached(self, content: str):
         self.errors = []
         self.warnings = []
-        
+        self._parse_and_validate(content)
+        return tuple(self.errors), tuple(self.warnings)
+
+    def _parse_and_validate(self, content: str) -> bool:
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_Loader)
             
             if data is None:
                 self.warnings.append("警告: 空のYAMLドキュメントです")
@@ -40,54 +93,248 @@ class YAMLValidator:
             self.errors.append(f"YAML解析エラー: {str(e)}")
             return False
 
-    def _validate_structure(self, data, path=""):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if not isinstance(key, str):
-                    self.warnings.append(f"警告: キー '{key}' は文字列ではありません ({path})")
-                
-                if value is None:
-                    self.warnings.append(f"警告: キー '{key}' の値が空です ({path})")
-                
-                new_path = f"{path}.{key}" if path else key
-                self._validate_structure(value, new_path)
-                
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                new_path = f"{path}[{i}]"
-                self._validate_structure(item, new_path)
+    def _validate_structure(self, data):
+        # 再帰の代わりに (子要素のイテレータ, パス, dictかどうか, id) のスタックで走査する。
+        # パス文字列は子がコンテナのときだけ作る
+        t = type(data)
+        if t is _DICT:
+            stack = [(iter(data.items()), "", True, id(data))]
+        elif t is _LIST:
+            stack = [(iter(enumerate(data)), "", False, id(data))]
+        else:
+            return
+
+        warn = self.warnings.append
+        push = stack.append
+        pop = stack.pop
+        # 現在のパス上にあるコンテナのid。自己参照するアンカーで無限に走査しないようにする
+        on_path = {id(data)}
+
+        while stack:
+            items, path, is_dict, container_id = stack[-1]
+            if is_dict:
+                for key, value in items:
+                    if not isinstance(key, str):
+                        warn(f"警告: キー '{key}' は文字列ではありません ({path})")
+                    if value is None:
+                        warn(f"警告: キー '{key}' の値が空です ({path})")
+                        continue
+
+                    t = type(value)
+                    if t is _DICT:
+                        child_id = id(value)
+                        if child_id in on_path:
+                            continue
+                        on_path.add(child_id)
+                        push((iter(value.items()), f"{path}.{key}" if path else key, True, child_id))
+                        break
+                    if t is _LIST:
+                        child_id = id(value)
+                        if child_id in on_path:
+                            continue
+                        on_path.add(child_id)
+                        push((iter(enumerate(value)), f"{path}.{key}" if path else key, False, child_id))
+                        break
+                else:
+                    pop()
+                    on_path.discard(container_id)
+            else:
+                for index, value in items:
+                    t = type(value)
+                    if t is _DICT:
+                        child_id = id(value)
+                        if child_id in on_path:
+                            continue
+                        on_path.add(child_id)
+                        push((iter(value.items()), f"{path}[{index}]", True, child_id))
+                        break
+                    if t is _LIST:
+                        child_id = id(value)
+                        if child_id in on_path:
+                            continue
+                        on_path.add(child_id)
+                        push((iter(enumerate(value)), f"{path}[{index}]", False, child_id))
+                        break
+                else:
+                    pop()
+                    on_path.discard(container_id)
 
     def _check_indentation(self, content: str):
-        lines = content.split('\n')
-        spaces_pattern = None
-        
-        for i, line in enumerate(lines, 1):
-            if line.strip() and not line.strip().startswith('#'):
-                indent = len(line) - len(line.lstrip())
-                if indent > 0:
-                    if spaces_pattern is None:
-                        spaces_pattern = indent
-                    elif indent % spaces_pattern != 0:
-                        self.warnings.append(f"警告: 行 {i} のインデントが一貫していません")
-
-    def get_report(self) -> str:
-        report = []
+        # 最初にインデントされた行の幅を基準にする
+        first = _LEADING_INDENT_RE.match(content) or _INDENT_RE.search(content)
+        if first is None:
+            return
+        spaces_pattern = first.end(1) - first.start(1)
+        if spaces_pattern == 1:
+            return
+
+        # 基準幅の倍数でない行だけを正規表現で探し、行番号は警告を出すときだけ数える
+        line_no = 1
+        last_pos = 0
+        warn = self.warnings.append
+        for m in _misaligned_indent_re(spaces_pattern).finditer(content, first.end()):
+            start = m.start() + 1
+            line_no += content.count('\n', last_pos, start)
+            last_pos = start
+            warn(f"警告: 行 {line_no} のインデントが一貫していません")
+
+    def get_report(self) -> Tuple[str, str]:
+        """レポート文字列と重要度 ('error' / 'warning' / 'ok') を返す"""
         if self.errors:
-            report.append("エラー:")
-            for error in self.errors:
-                report.append(f"- {error}")
-        
+            severity = 'error'
+        elif self.warnings:
+            severity = 'warning'
+        else:
+            severity = 'ok'
+
+        # 各項目をf文字列で組み立てず、区切り文字付きでまとめて連結する
+        sections = []
+        if self.errors:
+            sections.append("エラー:\n- " + "\n- ".join(self.errors))
         if self.warnings:
-            if report:
-                report.append("")
-            report.append("警告:")
-            for warning in self.warnings:
-                report.append(f"- {warning}")
-                
-        if not report:
-            report.append("✅ 検証に成功しました！問題は見つかりませんでした。")
-            
-        return "\n".join(report)
+            sections.append("警告:\n- " + "\n- ".join(self.warnings))
+
+        if not sections:
+            return "✅ 検証に成功しました！問題は見つかりませんでした。", severity
+        return "\n\n".join(sections), severity
+
+
+class FileLoaderSignals(QObject):
+    loaded = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class FileLoader(QRunnable):
+    """ファイルをワーカースレッドで読み込み、結果をシグナルでGUIスレッドへ返す
+
+    UTF-8として読み込み、先頭のBOMは取り除く。
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = FileLoaderSignals()
+
+    def run(self):
+        try:
+            with open(self.file_path, 'rb') as file:
+                # 空ファイルはmmapできない
+                if os.fstat(file.fileno()).st_size == 0:
+                    text = ""
+                else:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        text = str(mapped, 'utf-8-sig')
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(text)
+
+
+def load_file_async(file_path, on_loaded, on_failed):
+    loader = FileLoader(file_path)
+    loader.signals.loaded.connect(on_loaded)
+    loader.signals.failed.connect(on_failed)
+    QThreadPool.globalInstance().start(loader)
+
+
+class ValidationWorker(QObject):
+    """専用スレッド上でYAMLを検証し、(世代番号, レポート, 重要度) を返す"""
+    finished = pyqtSignal(int, str, str)
+
+    def __init__(self, validator):
+        super().__init__()
+        self.validator = validator
+        self._requests = queue.Queue()
+        # デーモンスレッドにして、検証中でもアプリの終了を待たせない
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, generation, content):
+        self._requests.put((generation, content))
+
+    def _run_loop(self):
+        get = self._requests.get
+        get_nowait = self._requests.get_nowait
+        while True:
+            request = get()
+            # 溜まった依頼は最新のものだけを検証する
+            while True:
+                try:
+                    request = get_nowait()
+                except queue.Empty:
+                    break
+            self.run(*request)
+
+    def run(self, generation, content):
+        # スロット内の未処理例外はアプリを終了させるため、エラーとして報告する
+        try:
+            self.validator.validate_content(content)
+            report, severity = self.validator.get_report()
+        except Exception as e:
+            report = f"エラー:\n- 検証中に予期しないエラーが発生しました: {str(e)}"
+            severity = 'error'
+        self.finished.emit(generation, report, severity)
+
+
+def _char_format(color, bold=False):
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    if bold:
+        fmt.setFontWeight(700)
+    return fmt
+
+
+class YAMLHighlighter(QSyntaxHighlighter):
+    """YAMLのキー・文字列・数値・コメントを色分けする"""
+
+    NUMBER_RE = QRegularExpression(r'(?<![\w.])[-+]?\d+(?:\.\d+)?(?![\w.])')
+    STRING_RE = QRegularExpression(r'"(?:[^"\\]|\\.)*"|\'(?:[^\']|\'\')*\'')
+    KEY_RE = QRegularExpression(r'^\s*(?:-\s+)?([^\s:#\-][^:]*?)\s*(?=:(?:\s|$))')
+    # コメント開始候補の '#'。文字列の中にあるものは除外する
+    COMMENT_RE = QRegularExpression(r'(?:^|\s)(#)')
+
+    NUMBER_FORMAT = _char_format("#1565c0")
+    STRING_FORMAT = _char_format("#2e7d32")
+    KEY_FORMAT = _char_format("#8e24aa", bold=True)
+    COMMENT_FORMAT = _char_format("#9e9e9e")
+
+    def highlightBlock(self, text):
+        set_format = self.setFormat
+
+        strings = []
+        matches = self.STRING_RE.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            strings.append((match.capturedStart(), match.capturedEnd()))
+
+        # 文字列の外にある最初の '#' からがコメント
+        comment_start = len(text)
+        matches = self.COMMENT_RE.globalMatch(text)
+        while matches.hasNext():
+            pos = matches.next().capturedStart(1)
+            if not any(start < pos < end for start, end in strings):
+                comment_start = pos
+                break
+
+        # 後から設定した書式ほど優先される: 数値 < 文字列 < キー < コメント
+        matches = self.NUMBER_RE.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            set_format(match.capturedStart(), match.capturedLength(), self.NUMBER_FORMAT)
+
+        for start, end in strings:
+            if start >= comment_start:
+                break
+            set_format(start, end - start, self.STRING_FORMAT)
+
+        match = self.KEY_RE.match(text)
+        if match.hasMatch():
+            set_format(match.capturedStart(1), match.capturedLength(1), self.KEY_FORMAT)
+
+        if comment_start < len(text):
+            set_format(comment_start, len(text) - comment_start, self.COMMENT_FORMAT)
 
 
 class LineNumberArea(QWidget):
@@ -101,30 +348,27 @@ class LineNumberArea(QWidget):
     def paintEvent(self, event):
         self.editor.line_number_area_paint_event(event)
 
-    def paintEvent(self, event):
-        self.editor.line_number_area_paint_event(event)
-
-class CodeEditor(QPlainTextEdit):
-    def __init__(self):
-        super().__init__()
-        self.setAcceptDrops(True)
-        self.line_number_area = LineNumberArea(self)
-        
-        self.blockCountChanged.connect(self.update_line_number_area_width)
-        self.updateRequest.connect(self.update_line_number_area)
-        self.cursorPositionChanged.connect(self.highlight_current_line)
-        
-        self.update_line_number_area_width(0)
-        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+class LineNumberMixin:
+    """QPlainTextEdit ベースのエディタ用の行番号表示"""
 
     def line_number_area_width(self):
-        digits = len(str(max(1, self.blockCount())))
-        space = 3 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
+        return 3 + self._digit_width * self._digits
 
     def update_line_number_area_width(self, _):
         self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
 
+    def update_line_number_digits(self, block_count):
+        digits = len(str(max(1, block_count)))
+        if digits != self._digits:
+            self._digits = digits
+            self.update_line_number_area_width(0)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._digit_width = self.fontMetrics().horizontalAdvance('9')
+            self.update_line_number_area_width(0)
+
     def update_line_number_area(self, rect, dy):
         if dy:
             self.line_number_area.scroll(0, dy)
@@ -142,128 +386,106 @@ class CodeEditor(QPlainTextEdit):
 
     def line_number_area_paint_event(self, event):
         painter = QPainter(self.line_number_area)
-        painter.fillRect(event.rect(), QColor("#f0f0f0"))
+        rect = event.rect()
+        painter.fillRect(rect, QColor("#f0f0f0"))
 
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
-        bottom = top + self.blockBoundingRect(block).height()
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(QColor("#808080"))
-                painter.drawText(0, int(top), self.line_number_area.width() - 2,
-                               self.fontMetrics().height(),
-                               Qt.AlignmentFlag.AlignRight, number)
+        # 折り返しなし・単一フォントなので各行の高さは一定
+        line_height = self.blockBoundingRect(block).height()
+        bottom = top + line_height
+
+        # ループ内で毎回参照しないようローカルに束縛する
+        rect_top = rect.top()
+        rect_bottom = rect.bottom()
+        area_width = self.line_number_area.width() - 2
+        font_height = self.fontMetrics().height()
+        align = Qt.AlignmentFlag.AlignRight
+        draw_text = painter.drawText
+        painter.setPen(QColor("#808080"))
+
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
+                draw_text(0, int(top), area_width, font_height, align, str(block_number + 1))
 
             block = block.next()
             top = bottom
-            bottom = top + self.blockBoundingRect(block).height()
+            bottom = top + line_height
             block_number += 1
 
+    def init_current_line_highlight(self):
+        self._last_highlighted_block = -1
+        self._current_line_selection = QTextEdit.ExtraSelection()
+        line_color = QColor("#f8f8f8")
+        self._current_line_selection.format.setBackground(line_color)
+        self._current_line_selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+
     def highlight_current_line(self):
+        cursor = self.textCursor()
+        # 同じ行内でのカーソル移動では再描画しない
+        block_number = cursor.blockNumber()
+        if block_number == self._last_highlighted_block:
+            return
+        self._last_highlighted_block = block_number
+
         extra_selections = []
         
         if not self.isReadOnly():
-            selection = QTextEdit.ExtraSelection()
-            line_color = QColor("#f8f8f8")
-            selection.format.setBackground(line_color)
-            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
-            selection.cursor = self.textCursor()
-            selection.cursor.clearSelection()
-            extra_selections.append(selection)
+            cursor.clearSelection()
+            self._current_line_selection.cursor = cursor
+            extra_selections.append(self._current_line_selection)
         
         self.setExtraSelections(extra_selections)
 
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        mime_data = event.mimeData()
-        if mime_data.hasUrls() or mime_data.hasText():
-            event.acceptProposedAction()
+class CodeEditor(LineNumberMixin, QPlainTextEdit):
+    # これより大きいテキストはGUIスレッドが長時間止まるためハイライトしない
+    HIGHLIGHT_MAX_CHARS = 200_000
 
-    def dropEvent(self, event: QDropEvent):
-        mime_data = event.mimeData()
-        if mime_data.hasUrls():
-            file_path = mime_data.urls()[0].toLocalFile()
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    self.setPlainText(file.read())
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"ファイル読み込みエラー: {str(e)}")
-        elif mime_data.hasText():
-            self.setPlainText(mime_data.text())
+    # load_text でテキストが置き換えられたときに発行する
+    text_loaded = pyqtSignal()
 
-class DropTextEditWithLineNumbers(QTextEdit):
     def __init__(self):
         super().__init__()
         self.setAcceptDrops(True)
         self.line_number_area = LineNumberArea(self)
+        # 行番号幅の計算用に数字幅と桁数をキャッシュする
+        self._digit_width = self.fontMetrics().horizontalAdvance('9')
+        self._digits = 1
+        self.init_current_line_highlight()
+        # ハイライタより先に接続し、大きな文書ではハイライト前に外せるようにする
+        self.document().contentsChange.connect(self.update_highlighter_attachment)
+        self.highlighter = YAMLHighlighter(self.document())
         
-        self.blockCountChanged.connect(self.update_line_number_area_width)
+        self.blockCountChanged.connect(self.update_line_number_digits)
         self.updateRequest.connect(self.update_line_number_area)
         self.cursorPositionChanged.connect(self.highlight_current_line)
         
         self.update_line_number_area_width(0)
-        self.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-
-    def line_number_area_width(self):
-        digits = len(str(max(1, self.document().blockCount())))
-        space = 3 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
-
-    def update_line_number_area_width(self, _):
-        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
-
-    def update_line_number_area(self, rect, dy):
-        if dy:
-            self.line_number_area.scroll(0, dy)
-        else:
-            self.line_number_area.update(0, rect.y(), self.line_number_area.width(), rect.height())
-        
-        if rect.contains(self.viewport().rect()):
-            self.update_line_number_area_width(0)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        cr = self.contentsRect()
-        self.line_number_area.setGeometry(QRect(cr.left(), cr.top(),
-                                              self.line_number_area_width(), cr.height()))
-
-    def line_number_area_paint_event(self, event):
-        painter = QPainter(self.line_number_area)
-        painter.fillRect(event.rect(), QColor("#f0f0f0"))
-
-        block = self.firstVisibleBlock()
-        block_number = block.blockNumber()
-        top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
-        bottom = top + self.blockBoundingRect(block).height()
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(QColor("#808080"))
-                painter.drawText(0, int(top), self.line_number_area.width() - 2,
-                               self.fontMetrics().height(),
-                               Qt.AlignmentFlag.AlignRight, number)
-
-            block = block.next()
-            top = bottom
-            bottom = top + self.blockBoundingRect(block).height()
-            block_number += 1
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
 
-    def highlight_current_line(self):
-        extra_selections = []
-        
-        if not self.isReadOnly():
-            selection = QTextEdit.ExtraSelection()
-            line_color = QColor("#f8f8f8")
-            selection.format.setBackground(line_color)
-            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
-            selection.cursor = self.textCursor()
-            selection.cursor.clearSelection()
-            extra_selections.append(selection)
-        
-        self.setExtraSelections(extra_selections)
+    def update_highlighter_attachment(self, *_):
+        # 読み込み・貼り付け・入力・クリアのいずれでも文書サイズだけで判断する
+        too_large = self.document().characterCount() > self.HIGHLIGHT_MAX_CHARS
+        attached = self.highlighter.document() is not None
+        if too_large and attached:
+            self.highlighter.setDocument(None)
+        elif not too_large and not attached:
+            self.highlighter.setDocument(self.document())
+
+    def load_text(self, text):
+        # 大量のテキスト設定中は行番号・カーソル関連のシグナルを止め、最後に一度だけ更新する
+        self.blockSignals(True)
+        try:
+            self.setPlainText(text)
+        finally:
+            self.blockSignals(False)
+        self.update_line_number_digits(self.document().blockCount())
+        self.update_line_number_area_width(0)
+        self.line_number_area.update()
+        self._last_highlighted_block = -1
+        self.highlight_current_line()
+        self.text_loaded.emit()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         mime_data = event.mimeData()
@@ -274,26 +496,62 @@ class DropTextEditWithLineNumbers(QTextEdit):
         mime_data = event.mimeData()
         if mime_data.hasUrls():
             file_path = mime_data.urls()[0].toLocalFile()
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    self.setText(file.read())
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"ファイル読み込みエラー: {str(e)}")
+            load_file_async(file_path, self.load_text, self.show_load_error)
         elif mime_data.hasText():
-            self.setText(mime_data.text())
+            self.load_text(mime_data.text())
+
+    def show_load_error(self, message):
+        QMessageBox.critical(self, "エラー", f"ファイル読み込みエラー: {message}")
+
+@functools.lru_cache(maxsize=8)
+def _resource_path(relative_path: str) -> str:
+    # PyInstallerで固めた場合は展開先ディレクトリから探す
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+# 検証結果の重要度ごとの表示
+_RESULT_STYLES = {
+    'error': "background-color: #ffebee;",
+    'warning': "background-color: #fff3e0;",
+    'ok': "background-color: #e8f5e9;",
+}
+_RESULT_MESSAGES = {
+    'error': '検証完了: エラーが見つかりました',
+    'warning': '検証完了: 警告があります',
+    'ok': '検証成功: 問題は見つかりませんでした',
+}
 
 # YAMLValidatorGUIクラスの更新
 class YAMLValidatorGUI(QMainWindow):
+    # 検証ボタンの連打をまとめる待ち時間 (ms)
+    VALIDATE_DEBOUNCE_MS = 250
+
+
     def __init__(self):
         super().__init__()
         self.validator = YAMLValidator()
+        # 検証要求ごとに増やし、古い検証結果を捨てるのに使う
+        self._validation_generation = 0
+        self._validation_pending = False
+
+        # 検証はワーカースレッドで行い、GUIスレッドをブロックしない
+        self.validation_worker = ValidationWorker(self.validator)
+        self.validation_worker.finished.connect(self.on_validation_finished)
+        self.validation_worker.start()
+
+        self.validate_timer = QTimer(self)
+        self.validate_timer.setSingleShot(True)
+        self.validate_timer.setInterval(self.VALIDATE_DEBOUNCE_MS)
+        self.validate_timer.timeout.connect(self.validate_yaml)
+
         self.initUI()
         
     def initUI(self):
         self.setWindowTitle('YAML Validator')
         self.setMinimumSize(800, 600)
 
-        icon_path = self._get_resource_path("icon.ico")
+        icon_path = _resource_path("icon.ico")
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
 
@@ -309,6 +567,7 @@ class YAMLValidatorGUI(QMainWindow):
         # CodeEditorを使用
         self.input_text = CodeEditor()
         self.input_text.setPlaceholderText("ここにYAMLを入力...")
+        self.input_text.text_loaded.connect(self.cancel_validation)
         layout.addWidget(self.input_text)
 
         button_layout = QHBoxLayout()
@@ -318,7 +577,7 @@ class YAMLValidatorGUI(QMainWindow):
         button_layout.addWidget(self.load_button)
 
         self.validate_button = QPushButton('検証')
-        self.validate_button.clicked.connect(self.validate_yaml)
+        self.validate_button.clicked.connect(self.request_validation)
         self.validate_button.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
@@ -375,11 +634,6 @@ class YAMLValidatorGUI(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
-    def _get_resource_path(self, relative_path):
-        if hasattr(sys, '_MEIPASS'):
-            return os.path.join(sys._MEIPASS, relative_path)
-        return os.path.join(os.path.abspath("."), relative_path)
-
     def load_file(self):
         file_name, _ = QFileDialog.getOpenFileName(
             self,
@@ -389,42 +643,61 @@ class YAMLValidatorGUI(QMainWindow):
         )
         
         if file_name:
-            try:
-                with open(file_name, 'r', encoding='utf-8') as file:
-                    self.input_text.setText(file.read())
-                self.statusBar.showMessage(f'ファイルを読み込みました: {file_name}')
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"ファイル読み込みエラー: {str(e)}")
-                self.statusBar.showMessage('ファイル読み込みに失敗しました')
+            self.statusBar.showMessage(f'ファイルを読み込んでいます: {file_name}')
+            load_file_async(file_name,
+                            lambda text: self.on_file_loaded(file_name, text),
+                            self.on_file_load_failed)
+
+    def on_file_loaded(self, file_name, text):
+        self.input_text.load_text(text)
+        self.statusBar.showMessage(f'ファイルを読み込みました: {file_name}')
+
+    def on_file_load_failed(self, message):
+        QMessageBox.critical(self, "エラー", f"ファイル読み込みエラー: {message}")
+        self.statusBar.showMessage('ファイル読み込みに失敗しました')
+
+    def request_validation(self):
+        # 待ち時間内の連続クリックは1回の検証にまとめる
+        self.validate_timer.start()
 
     def validate_yaml(self):
+        self._validation_generation += 1
         content = self.input_text.toPlainText()
         if not content.strip():
+            self._validation_pending = False
             self.result_text.setText("エラー: YAMLテキストを入力してください。")
             self.statusBar.showMessage('検証失敗: 入力が空です')
             return
 
-        self.validator.validate_content(content)
-        report = self.validator.get_report()
-        
-        if "エラー:" in report:
-            self.result_text.setStyleSheet("background-color: #ffebee;")
-            self.statusBar.showMessage('検証完了: エラーが見つかりました')
-        elif "警告:" in report:
-            self.result_text.setStyleSheet("background-color: #fff3e0;")
-            self.statusBar.showMessage('検証完了: 警告があります')
-        else:
-            self.result_text.setStyleSheet("background-color: #e8f5e9;")
-            self.statusBar.showMessage('検証成功: 問題は見つかりませんでした')
-            
+        self._validation_pending = True
+        self.statusBar.showMessage('検証中...')
+        self.validation_worker.submit(self._validation_generation, content)
+
+    def cancel_validation(self):
+        # 実行中・待機中の検証結果を無効にする
+        self.validate_timer.stop()
+        self._validation_generation += 1
+        if self._validation_pending:
+            self._validation_pending = False
+            self.statusBar.showMessage('検証を中止しました')
+
+    def on_validation_finished(self, generation, report, severity):
+        if generation != self._validation_generation:
+            return
+        self._validation_pending = False
+        self.result_text.setStyleSheet(_RESULT_STYLES[severity])
+        self.statusBar.showMessage(_RESULT_MESSAGES[severity])
         self.result_text.setText(report)
 
     def clear_all(self):
+        self.cancel_validation()
         self.input_text.clear()
+        self.input_text.update_highlighter_attachment()
         self.result_text.clear()
         self.result_text.setStyleSheet("")
         self.statusBar.showMessage('入力をクリアしました')
 
+
     def show_about(self):
         QMessageBox.about(self,
             "YAML Validator について",